@@ -8,14 +8,115 @@ root-finding methods (Bisection, Newton, and Secant) for different functions.
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from Bisect_Method import bisect_animation
 from Newton_Method import newton_animation
 from Secant_Method import secant_animation
 
+# Sampled curves keyed on (f, x_min, x_max, num_points), shared by every plot
+_CURVE_CACHE: dict[tuple, tuple[np.ndarray, np.ndarray]] = {}
+
+def _as_ufunc(f):
+    """
+    Return a version of f that evaluates element-wise over a NumPy array.
+    
+    The test functions are written with NumPy operations and already accept
+    arrays, so f is called directly. Functions that only handle scalars fall
+    back to np.frompyfunc.
+    """
+    def evaluate(x):
+        try:
+            y = np.asarray(f(x), dtype=float)
+            if y.shape == np.shape(x):
+                return y
+        except (TypeError, ValueError):
+            pass
+        return np.frompyfunc(f, 1, 1)(x).astype(float)
+    return evaluate
+
+def _curve(f, x_min, x_max, num=1000):
+    """Return (x, f(x)) sampled on num points, reusing earlier samples of the same range."""
+    key = (f, round(x_min, 6), round(x_max, 6), num)
+    if key not in _CURVE_CACHE:
+        x = np.linspace(x_min, x_max, num)
+        y = _as_ufunc(f)(x)
+        x.flags.writeable = False
+        y.flags.writeable = False
+        _CURVE_CACHE[key] = (x, y)
+    return _CURVE_CACHE[key]
+
+def _new_figure(batch):
+    """Create the animation figure, on an off-screen Agg canvas in batch mode."""
+    if batch:
+        fig = Figure(figsize=(12, 7))
+        FigureCanvasAgg(fig)
+        return fig, fig.add_subplot()
+    return plt.subplots(figsize=(12, 7))
+
+def _blit_loop(fig, ax, init, update, frames, interval):
+    """
+    Play the animation in a window with manual blitting.
+    
+    The static part of the axes is cached once per full redraw; each frame
+    restores it and redraws only the artists returned by update().
+    """
+    artists = init()
+    background = None
+    
+    def on_draw(event):
+        # A full redraw (first show, resize) leaves out the animated artists
+        nonlocal background
+        background = fig.canvas.copy_from_bbox(ax.bbox)
+        for artist in artists:
+            ax.draw_artist(artist)
+    
+    fig.canvas.mpl_connect('draw_event', on_draw)
+    plt.show(block=False)
+    fig.canvas.draw()
+    
+    for frame in range(frames):
+        if not plt.fignum_exists(fig.number):
+            return
+        fig.canvas.restore_region(background)
+        artists = update(frame)
+        for artist in artists:
+            ax.draw_artist(artist)
+        fig.canvas.blit(ax.bbox)
+        fig.canvas.flush_events()
+        fig.canvas.start_event_loop(interval / 1000)
+    
+    # Keep the final frame on screen until the window is closed
+    plt.show()
+
+def _batch_outfile(method, fname, *start):
+    """Default video file for batch mode, e.g. newton_f1_0.5.mp4 for method, function and start values."""
+    return "_".join([method, fname.split("(")[0], *(f"{v:g}" for v in start)]) + ".mp4"
+
+def _can_blit_live(fig):
+    """Whether fig is shown in an interactive window whose canvas supports blitting."""
+    canvas = fig.canvas
+    return canvas.supports_blit and type(canvas).required_interactive_framework is not None
+
+def _present(fig, ax, init, update, frames, batch, outfile):
+    """Play the animation in a window, or save it to outfile in batch mode."""
+    fig.subplots_adjust(left=0.08, right=0.98, top=0.93, bottom=0.09)
+    if batch:
+        anim = FuncAnimation(fig, update, frames=frames, init_func=init,
+                             interval=1000, blit=True, cache_frame_data=False)
+        anim.save(outfile, writer='ffmpeg', fps=1)
+        print(f"Animation saved to {outfile}")
+    elif _can_blit_live(fig):
+        _blit_loop(fig, ax, init, update, frames, interval=1000)
+    else:
+        # Non-interactive or non-blitting canvases (Agg, SVG, cairo) keep FuncAnimation's own handling
+        anim = FuncAnimation(fig, update, frames=frames, init_func=init, interval=1000,
+                             blit=fig.canvas.supports_blit, cache_frame_data=False)
+        plt.show()
+
 def display_function(f, fname, x_range):
     """Display the function graph with the specified range."""
-    x = np.linspace(x_range[0], x_range[1], 1000)
-    y = [f(xi) for xi in x]
+    x, y = _curve(f, x_range[0], x_range[1])
     
     plt.figure(figsize=(10, 6))
     plt.plot(x, y, 'b-', linewidth=2)
@@ -31,24 +132,30 @@ def display_function(f, fname, x_range):
     
     plt.show()
 
-def animate_bisection(f, a, b, M, epsilon, fname):
-    """Create and display animation for the bisection method."""
+def animate_bisection(f, a, b, M, epsilon, fname, batch=False, outfile=None):
+    """
+    Create and display animation for the bisection method. In batch mode it is saved to
+    outfile instead, by default bisection_<function>_<a>_<b>.mp4.
+    """
     try:
-        x_vals, fx_vals, intervals = bisect_animation(a, b, M, epsilon, f)
+        result = bisect_animation(a, b, M, epsilon, f)
+        if result is None:
+            print(f"f({a}) and f({b}) have the same sign; [{a}, {b}] does not bracket a root.")
+            return
+        x_vals, fx_vals, intervals = result
         
         # Create the figure and axis
-        fig, ax = plt.subplots(figsize=(12, 7))
+        fig, ax = _new_figure(batch)
         
         # Plot the function
         x_range = (min(a, b) - 1, max(a, b) + 1)
-        x = np.linspace(x_range[0], x_range[1], 1000)
-        y = [f(xi) for xi in x]
+        x, y = _curve(f, x_range[0], x_range[1])
         ax.plot(x, y, 'b-', label=fname, linewidth=2)
         ax.axhline(y=0, color='r', linestyle='--', alpha=0.7, label='y=0')
         
         # Initialize interval line and point
-        interval_line, = ax.plot([], [], 'g-', linewidth=2, label='Current Interval')
-        point, = ax.plot([], [], 'ro', markersize=8, label='Current Point')
+        interval_line, = ax.plot([], [], 'g-', linewidth=2, label='Current Interval', animated=True)
+        point, = ax.plot([], [], 'ro', markersize=8, label='Current Point', animated=True)
         
         # Add labels and legend
         ax.set_title(f"Bisection Method Animation - {fname}", fontsize=16)
@@ -59,13 +166,14 @@ def animate_bisection(f, a, b, M, epsilon, fname):
         
         # Set axis limits
         ax.set_xlim(x_range)
-        y_min, y_max = min(y), max(y)
+        y_min, y_max = float(y.min()), float(y.max())
         margin = (y_max - y_min) * 0.1
         ax.set_ylim(y_min - margin, y_max + margin)
+        ax.set_autoscale_on(False)
         
         # Initialize text elements
-        iteration_text = ax.text(0.02, 0.95, '', transform=ax.transAxes)
-        value_text = ax.text(0.02, 0.90, '', transform=ax.transAxes)
+        iteration_text = ax.text(0.02, 0.95, '', transform=ax.transAxes, animated=True)
+        value_text = ax.text(0.02, 0.90, '', transform=ax.transAxes, animated=True)
         
         def init():
             interval_line.set_data([], [])
@@ -92,38 +200,37 @@ def animate_bisection(f, a, b, M, epsilon, fname):
             
             return interval_line, point, iteration_text, value_text
         
-        # Create animation
-        anim = FuncAnimation(fig, update, frames=len(x_vals)+5, init_func=init, 
-                             interval=1000, blit=True)
-        
-        plt.tight_layout()
-        plt.show()
+        # Run the animation
+        _present(fig, ax, init, update, len(x_vals)+5, batch,
+                 outfile or _batch_outfile('bisection', fname, a, b))
         
-    except Exception as e:
+    except (ValueError, ArithmeticError, RuntimeError) as e:
         print(f"Animation error: {e}")
         return
 
-def animate_newton(f, fprime, x0, nmax, epsilon, fname):
-    """Create and display animation for Newton's method."""
+def animate_newton(f, fprime, x0, nmax, epsilon, fname, batch=False, outfile=None):
+    """
+    Create and display animation for Newton's method. In batch mode it is saved to
+    outfile instead, by default newton_<function>_<x0>.mp4.
+    """
     try:
-        x_vals, fx_vals, tangents = newton_animation(f, fprime, x0, nmax, epsilon)
+        x_vals, fx_vals, tangents, next_x = newton_animation(f, fprime, x0, nmax, epsilon)
         
         # Create the figure and axis
-        fig, ax = plt.subplots(figsize=(12, 7))
+        fig, ax = _new_figure(batch)
         
         # Determine x range based on x_vals
-        x_min, x_max = min(x_vals) - 1, max(x_vals) + 1
+        x_min, x_max = x_vals.min() - 1, x_vals.max() + 1
         
         # Plot the function
-        x = np.linspace(x_min, x_max, 1000)
-        y = [f(xi) for xi in x]
+        x, y = _curve(f, x_min, x_max)
         ax.plot(x, y, 'b-', label=fname, linewidth=2)
         ax.axhline(y=0, color='r', linestyle='--', alpha=0.7, label='y=0')
         
         # Initialize tangent line and point
-        tangent_line, = ax.plot([], [], 'g-', linewidth=2, label='Tangent Line')
-        point, = ax.plot([], [], 'ro', markersize=8, label='Current Point')
-        next_point, = ax.plot([], [], 'mo', markersize=8, label='Next Approximation')
+        tangent_line, = ax.plot([], [], 'g-', linewidth=2, label='Tangent Line', animated=True)
+        point, = ax.plot([], [], 'ro', markersize=8, label='Current Point', animated=True)
+        next_point, = ax.plot([], [], 'mo', markersize=8, label='Next Approximation', animated=True)
         
         # Add labels and legend
         ax.set_title(f"Newton's Method Animation - {fname}", fontsize=16)
@@ -134,13 +241,17 @@ def animate_newton(f, fprime, x0, nmax, epsilon, fname):
         
         # Set axis limits
         ax.set_xlim(x_min, x_max)
-        y_min, y_max = min(y), max(y)
+        y_min, y_max = float(y.min()), float(y.max())
         margin = (y_max - y_min) * 0.1
         ax.set_ylim(y_min - margin, y_max + margin)
+        ax.set_autoscale_on(False)
         
         # Initialize text elements
-        iteration_text = ax.text(0.02, 0.95, '', transform=ax.transAxes)
-        value_text = ax.text(0.02, 0.90, '', transform=ax.transAxes)
+        iteration_text = ax.text(0.02, 0.95, '', transform=ax.transAxes, animated=True)
+        value_text = ax.text(0.02, 0.90, '', transform=ax.transAxes, animated=True)
+        
+        # Offsets from x_i spanned by the tangent line, shared by every frame
+        unit = np.linspace(-1, 1, 100)
         
         def init():
             tangent_line.set_data([], [])
@@ -154,17 +265,14 @@ def animate_newton(f, fprime, x0, nmax, epsilon, fname):
             if frame < len(tangents):
                 x_i, fx_i, fp_i = tangents[frame]
                 
-                # Calculate tangent line
-                x_tangent = np.linspace(x_i - 1, x_i + 1, 100)
-                y_tangent = [fx_i + fp_i * (xt - x_i) for xt in x_tangent]
-                tangent_line.set_data(x_tangent, y_tangent)
+                # Shift the unit offsets onto the tangent at x_i
+                tangent_line.set_data(x_i + unit, fx_i + fp_i * unit)
                 
                 # Update points
                 point.set_data([x_i], [fx_i])
                 
-                # Calculate next x value (where tangent intersects x-axis)
-                next_x = x_i - fx_i / fp_i
-                next_point.set_data([next_x], [0])
+                # Next x value (where tangent intersects x-axis)
+                next_point.set_data([next_x[frame]], [0.0])
                 
                 # Update text
                 iteration_text.set_text(f'Iteration: {frame}')
@@ -172,39 +280,38 @@ def animate_newton(f, fprime, x0, nmax, epsilon, fname):
             
             return tangent_line, point, next_point, iteration_text, value_text
         
-        # Create animation
-        anim = FuncAnimation(fig, update, frames=len(tangents)+5, init_func=init, 
-                             interval=1000, blit=True)
-        
-        plt.tight_layout()
-        plt.show()
+        # Run the animation
+        _present(fig, ax, init, update, len(tangents)+5, batch,
+                 outfile or _batch_outfile('newton', fname, x0))
         
-    except Exception as e:
+    except (ValueError, ArithmeticError, RuntimeError) as e:
         print(f"Animation error: {e}")
         return
 
-def animate_secant(f, x0, x1, nmax, epsilon, fname):
-    """Create and display animation for the secant method."""
+def animate_secant(f, x0, x1, nmax, epsilon, fname, batch=False, outfile=None):
+    """
+    Create and display animation for the secant method. In batch mode it is saved to
+    outfile instead, by default secant_<function>_<x0>_<x1>.mp4.
+    """
     try:
-        x_vals, fx_vals, secants = secant_animation(f, x0, x1, nmax, epsilon)
+        x_vals, fx_vals, secants, next_x = secant_animation(f, x0, x1, nmax, epsilon)
         
         # Create the figure and axis
-        fig, ax = plt.subplots(figsize=(12, 7))
+        fig, ax = _new_figure(batch)
         
         # Determine x range based on x_vals
-        x_min, x_max = min(x_vals) - 1, max(x_vals) + 1
+        x_min, x_max = x_vals.min() - 1, x_vals.max() + 1
         
         # Plot the function
-        x = np.linspace(x_min, x_max, 1000)
-        y = [f(xi) for xi in x]
+        x, y = _curve(f, x_min, x_max)
         ax.plot(x, y, 'b-', label=fname, linewidth=2)
         ax.axhline(y=0, color='r', linestyle='--', alpha=0.7, label='y=0')
         
         # Initialize secant line and points
-        secant_line, = ax.plot([], [], 'g-', linewidth=2, label='Secant Line')
-        point1, = ax.plot([], [], 'ro', markersize=6, label='Previous Point')
-        point2, = ax.plot([], [], 'mo', markersize=6, label='Current Point')
-        next_point, = ax.plot([], [], 'go', markersize=8, label='Next Approximation')
+        secant_line, = ax.plot([], [], 'g-', linewidth=2, label='Secant Line', animated=True)
+        point1, = ax.plot([], [], 'ro', markersize=6, label='Previous Point', animated=True)
+        point2, = ax.plot([], [], 'mo', markersize=6, label='Current Point', animated=True)
+        next_point, = ax.plot([], [], 'go', markersize=8, label='Next Approximation', animated=True)
         
         # Add labels and legend
         ax.set_title(f"Secant Method Animation - {fname}", fontsize=16)
@@ -215,13 +322,14 @@ def animate_secant(f, x0, x1, nmax, epsilon, fname):
         
         # Set axis limits
         ax.set_xlim(x_min, x_max)
-        y_min, y_max = min(y), max(y)
+        y_min, y_max = float(y.min()), float(y.max())
         margin = (y_max - y_min) * 0.1
         ax.set_ylim(y_min - margin, y_max + margin)
+        ax.set_autoscale_on(False)
         
         # Initialize text elements
-        iteration_text = ax.text(0.02, 0.95, '', transform=ax.transAxes)
-        value_text = ax.text(0.02, 0.90, '', transform=ax.transAxes)
+        iteration_text = ax.text(0.02, 0.95, '', transform=ax.transAxes, animated=True)
+        value_text = ax.text(0.02, 0.90, '', transform=ax.transAxes, animated=True)
         
         def init():
             secant_line.set_data([], [])
@@ -243,10 +351,8 @@ def animate_secant(f, x0, x1, nmax, epsilon, fname):
                 point1.set_data([x0_i], [fx0_i])
                 point2.set_data([x1_i], [fx1_i])
                 
-                # Calculate next x value (where secant intersects x-axis)
-                slope = (fx1_i - fx0_i) / (x1_i - x0_i)
-                next_x = x1_i - fx1_i / slope if abs(slope) > 1e-10 else x1_i
-                next_point.set_data([next_x], [0])
+                # Next x value (where secant intersects x-axis)
+                next_point.set_data([next_x[frame]], [0.0])
                 
                 # Update text
                 iteration_text.set_text(f'Iteration: {frame}')
@@ -254,24 +360,22 @@ def animate_secant(f, x0, x1, nmax, epsilon, fname):
             
             return secant_line, point1, point2, next_point, iteration_text, value_text
         
-        # Create animation
-        anim = FuncAnimation(fig, update, frames=len(secants)+5, init_func=init, 
-                             interval=1000, blit=True)
-        
-        plt.tight_layout()
-        plt.show()
+        # Run the animation
+        _present(fig, ax, init, update, len(secants)+5, batch,
+                 outfile or _batch_outfile('secant', fname, x0, x1))
         
-    except Exception as e:
+    except (ValueError, ArithmeticError, RuntimeError) as e:
         print(f"Animation error: {e}")
         return
 
-def manage_animations(f1, f2, f3, f1_prime, f2_prime, f3_prime):
+def manage_animations(f1, f2, f3, f1_prime, f2_prime, f3_prime, batch=False):
     """
     Main function to manage animations based on user input.
     
     Parameters:
     - f1, f2, f3: The three test functions
     - f1_prime, f2_prime, f3_prime: Their derivatives
+    - batch: Save animations to video files (requires ffmpeg) instead of opening windows
     """
     functions = {
         '1': (f1, f1_prime, "f1(x) = x^2 - 4*sin(x)", (-3, 3)),
@@ -311,8 +415,9 @@ def manage_animations(f1, f2, f3, f1_prime, f2_prime, f3_prime):
         f, fprime, fname, x_range = functions[function_choice]
         
         # Show function graph
-        print(f"\nDisplaying graph for {fname}...")
-        display_function(f, fname, x_range)
+        if not batch:
+            print(f"\nDisplaying graph for {fname}...")
+            display_function(f, fname, x_range)
         
         # Select method
         print("\nSelect a method to animate:")
@@ -347,7 +452,7 @@ def manage_animations(f1, f2, f3, f1_prime, f2_prime, f3_prime):
                 idx = int(interval_choice) - 1
                 if 0 <= idx < len(intervals):
                     a, b = intervals[idx]
-                    animate_bisection(f, a, b, 25, 1e-12, fname)
+                    animate_bisection(f, a, b, 25, 1e-12, fname, batch)
                 else:
                     print("Invalid interval choice.")
             except ValueError:
@@ -372,7 +477,7 @@ def manage_animations(f1, f2, f3, f1_prime, f2_prime, f3_prime):
                 idx = int(x0_choice) - 1
                 if 0 <= idx < len(x0_options):
                     x0 = x0_options[idx]
-                    animate_newton(f, fprime, x0, 25, 1e-12, fname)
+                    animate_newton(f, fprime, x0, 25, 1e-12, fname, batch)
                 else:
                     print("Invalid choice.")
             except ValueError:
@@ -397,7 +502,7 @@ def manage_animations(f1, f2, f3, f1_prime, f2_prime, f3_prime):
                 idx = int(points_choice) - 1
                 if 0 <= idx < len(point_options):
                     x0, x1 = point_options[idx]
-                    animate_secant(f, x0, x1, 25, 1e-12, fname)
+                    animate_secant(f, x0, x1, 25, 1e-12, fname, batch)
                 else:
                     print("Invalid choice.")
             except ValueError:
@@ -410,6 +515,7 @@ def manage_animations(f1, f2, f3, f1_prime, f2_prime, f3_prime):
             break
 
 if __name__ == "__main__":
-    # If run directly, this will demonstrate the animation functions
+    # If run directly, this will demonstrate the animation functions; --batch saves them as videos
+    import sys
     from main import f1, f2, f3, f1_prime, f2_prime, f3_prime
-    manage_animations(f1, f2, f3, f1_prime, f2_prime, f3_prime)
+    manage_animations(f1, f2, f3, f1_prime, f2_prime, f3_prime, batch='--batch' in sys.argv[1:])
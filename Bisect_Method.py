@@ -1,99 +1,107 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
 
-def sign(a) -> int:
-    if a < 0:
-        return -1
-    else:
-        return 1
-
-def bisect_method(a, b, M, err1, epsilon, f):
-    fa: float = f(a)
-    fb: float = f(b)
-    e: float = b - a
-    print(f"a: {a}\nb: {b}\nf(a): {fa}\nf(b): {fb}")
+def _bisect_core(a, fa, b, M, err1, epsilon, f):
+    """
+    Bisection iteration without any output, starting from the already evaluated
+    fa = f(a) and assuming f(a) and f(b) differ in sign. Returns (c, f(c), iterations, converged).
+    """
+    e = b - a
+    c, fc = a, fa
     
-    if sign(fa) == sign(fb):
-        return "Same Sign"
-
     for i in range(1, M):
         e = e/2
         c = a + e
         fc = f(c)
-        print (f"i: {i}\nc: {c}\nf(c): {fc}\ne: {e}")
         
-        if abs(e) < err1 or abs(fc) < epsilon:
-            return f"Root found at ({c},{fc})"
+        if fc == 0.0 or abs(e) < err1 or abs(fc) < epsilon:
+            return c, fc, i, True
 
-        if sign(fc) != sign(f(a)):
+        if (fc < 0.0) != (fa < 0.0):
             b = c
-            fb = fc     
         else:
             a = c
-            fa = c
+            fa = fc
+    
+    return c, fc, M - 1, False
+
+def bisect_method(a, b, M, err1, epsilon, f):
+    fa: float = f(a)
+    fb: float = f(b)
+    print(f"a: {a}\nb: {b}\nf(a): {fa}\nf(b): {fb}")
+    
+    if (fa < 0.0) == (fb < 0.0):
+        return "Same Sign"
+
+    c, fc, i, converged = _bisect_core(a, fa, b, M, err1, epsilon, f)
+    if converged:
+        print (f"i: {i}\nc: {c}\nf(c): {fc}")
+        return f"Root found at ({c},{fc})"
 
 def bisect_method_with_plot(a, b, M, err1, epsilon, f):
     fa = f(a)
     fb = f(b)
     e = b - a
-    x_vals = []
-    fx_vals = []
+    x_vals = np.empty(M)
+    fx_vals = np.empty(M)
+    n = 0
     
     print(f"a: {a}\nb: {b}\nf(a): {fa}\nf(b): {fb}")
     
-    if sign(fa) == sign(fb):
-        return "Same Sign"
+    if (fa < 0.0) == (fb < 0.0):
+        return None
 
     for i in range(1, M + 1):
         e = e / 2
         c = a + e
         fc = f(c)
-        x_vals.append(c)
-        fx_vals.append(fc)
+        x_vals[n] = c
+        fx_vals[n] = fc
+        n += 1
         print(f"i: {i}\nc: {c}\nf(c): {fc}\ne: {e}")
         
-        if abs(e) < err1 or abs(fc) < epsilon:
+        if fc == 0.0 or abs(e) < err1 or abs(fc) < epsilon:
             print("Convergence achieved.")
             break
 
-        if sign(fc) != sign(f(a)):
+        if (fc < 0.0) != (fa < 0.0):
             b = c
             fb = fc     
         else:
             a = c
             fa = fc
     
-    return x_vals, fx_vals
+    return x_vals[:n], fx_vals[:n]
 
 def bisect_animation(a, b, M, epsilon, f):
     fa = f(a)
     fb = f(b)
     e = b - a
-    x_vals = []
-    fx_vals = []
+    x_vals = np.empty(M)
+    fx_vals = np.empty(M)
     intervals = []
+    n = 0
     
-    if sign(fa) == sign(fb):
-        return "Same Sign"
+    if (fa < 0.0) == (fb < 0.0):
+        return None
 
     for i in range(1, M + 1):
         e = e / 2
         c = a + e
         fc = f(c)
-        x_vals.append(c)
-        fx_vals.append(fc)
+        x_vals[n] = c
+        fx_vals[n] = fc
         intervals.append((a, b))
+        n += 1
         
-        if abs(e) < epsilon or abs(fc) < epsilon:
+        if fc == 0.0 or abs(e) < epsilon or abs(fc) < epsilon:
             break
 
-        if sign(fc) != sign(f(a)):
+        if (fc < 0.0) != (fa < 0.0):
             b = c
             fb = fc     
         else:
             a = c
             fa = fc
     
-    return x_vals, fx_vals, intervals
+    return x_vals[:n], fx_vals[:n], intervals
 
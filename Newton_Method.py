@@ -1,7 +1,74 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
-import math
+
+def _make_newton(record, fused=False):
+    """
+    Build a Newton iteration loop that reports each step to record.
+    
+    record(out, i, x, fx, fp, d, x_new, fx_new) is called after step i moves
+    from x to x_new, with the caller's out object passed through unchanged.
+    The returned function starts from x with fx = f(x), runs at most nmax
+    steps and returns (x, f(x), iterations, converged). Stopping early
+    without converging means a small derivative was encountered.
+    
+    With fused=True the loop takes a single fdf(x) returning (f(x), f'(x))
+    and the starting derivative fp, so shared work is done once per step.
+    """
+    def run(f, fprime, x, fx, nmax, err1, err2, epsilon, out=None):
+        for i in range(1, nmax + 1):
+            fp = fprime(x)
+            if abs(fp) < epsilon:
+                return x, fx, i - 1, False
+            
+            d = fx / fp
+            x_new = x - d
+            fx_new = f(x_new)
+            record(out, i, x, fx, fp, d, x_new, fx_new)
+            x, fx = x_new, fx_new
+            if abs(d) < err1 or abs(fx) < err2:
+                return x, fx, i, True
+        
+        return x, fx, nmax, False
+    
+    def run_fused(fdf, x, fx, fp, nmax, err1, err2, epsilon, out=None):
+        for i in range(1, nmax + 1):
+            if abs(fp) < epsilon:
+                return x, fx, i - 1, False
+            
+            d = fx / fp
+            x_new = x - d
+            fx_new, fp_new = fdf(x_new)
+            record(out, i, x, fx, fp, d, x_new, fx_new)
+            x, fx, fp = x_new, fx_new, fp_new
+            if abs(d) < err1 or abs(fx) < err2:
+                return x, fx, i, True
+        
+        return x, fx, nmax, False
+    
+    return run_fused if fused else run
+
+def _ignore_step(out, i, x, fx, fp, d, x_new, fx_new):
+    pass
+
+def _print_and_store_step(out, i, x, fx, fp, d, x_new, fx_new):
+    x_vals, fx_vals = out
+    x_vals[i] = x_new
+    fx_vals[i] = fx_new
+    print(f"\nIteration {i}:\n"
+          f"x = {x_new}\n"
+          f"f(x) = {fx_new}\n"
+          f"difference = {d}")
+
+def _store_tangent_step(out, i, x, fx, fp, d, x_new, fx_new):
+    x_vals, fx_vals, tangents = out
+    tangents[i - 1] = x, fx, fp
+    x_vals[i] = x_new
+    fx_vals[i] = fx_new
+
+# Loop specializations shared by the functions below
+_newton_core = _make_newton(_ignore_step)
+_newton_plot_steps = _make_newton(_print_and_store_step)
+_newton_plot_fused_steps = _make_newton(_print_and_store_step, fused=True)
+_newton_animation_steps = _make_newton(_store_tangent_step)
 
 # Your Original Function
 def newton_method(f, fprime, x, nmax, err1, err2, epsilon):
@@ -19,72 +86,92 @@ def newton_method(f, fprime, x, nmax, err1, err2, epsilon):
     fx = f(x)
     print(f"x: {x}\nf(x): {fx}")
     
-    for i in range(1, nmax):
-        fp = fprime(x)
-        if abs(fp) < epsilon:
-            print("Small Derivative")
-            return
-        
-        d = fx / fp
-        x = x - d
-        fx = f(x)
+    # Iterations run over range(1, nmax)
+    x, fx, i, converged = _newton_core(f, fprime, x, fx, nmax - 1, err1, err2, epsilon)
+    if converged:
         print(f"i: {i}\nx: {x}\nf(x): {fx}")
-        if abs(d) < err1 or abs(fx) < err2:
-            print("Converge")
-            return f"Zero at ({x}, {fx})"
+        print("Converge")
+        return f"Zero at ({x}, {fx})"
+    if i < nmax - 1:
+        print("Small Derivative")
 
 # Enhanced Function with Better Output Formatting
 def newton_method_with_plot(f, fprime, x0, nmax, err1, err2, epsilon):
     """
     Newton's Method for finding roots with visualization support.
+    Pass fprime=None when f returns the pair (f(x), f'(x)) from one call.
     """
     print("Starting Newton's Method...\n")
-    x = x0
-    fx = f(x)
-    x_vals = [x]
-    fx_vals = [fx]
+    if fprime is None:
+        fx0, fp0 = f(x0)
+    else:
+        fx0 = f(x0)
+    x_vals = np.empty(nmax + 1)
+    fx_vals = np.empty(nmax + 1)
+    x_vals[0] = x0
+    fx_vals[0] = fx0
     
-    print(f"Initial guess:\nx = {x}\nf(x) = {fx}")
+    print(f"Initial guess:\nx = {x0}\nf(x) = {fx0}")
     
-    for i in range(1, nmax + 1):
-        fp = fprime(x)
-        if abs(fp) < epsilon:
-            print(f"\nIteration {i}:\nSmall derivative encountered. Stopping computation.")
-            break
-        
-        d = fx / fp
-        x -= d
-        fx = f(x)
-        x_vals.append(x)
-        fx_vals.append(fx)
-        print(f"\nIteration {i}:\n"
-              f"x = {x}\n"
-              f"f(x) = {fx}\n"
-              f"difference = {d}")
-        
-        if abs(d) < err1 or abs(fx) < err2:
-            print("\nConvergence achieved.")
-            break
+    if fprime is None:
+        _, _, n, converged = _newton_plot_fused_steps(f, x0, fx0, fp0, nmax, err1, err2, epsilon,
+                                                      out=(x_vals, fx_vals))
+    else:
+        _, _, n, converged = _newton_plot_steps(f, fprime, x0, fx0, nmax, err1, err2, epsilon,
+                                                out=(x_vals, fx_vals))
+    if converged:
+        print("\nConvergence achieved.")
+    elif n < nmax:
+        print(f"\nIteration {n + 1}:\nSmall derivative encountered. Stopping computation.")
     
-    return x_vals, fx_vals
+    return x_vals[:n + 1], fx_vals[:n + 1]
 
 # Animation Function
 def newton_animation(f, fprime, x0, nmax, epsilon):
     # Initialize variables
-    x_vals = [x0]
-    fx_vals = [f(x0)]
-    tangents = []
+    x_vals = np.empty(nmax + 1)
+    fx_vals = np.empty(nmax + 1)
+    tangents = np.empty((nmax, 3))
+    
+    fx0 = f(x0)
+    x_vals[0] = x0
+    fx_vals[0] = fx0
+    # Run every step up to nmax: only a small derivative stops the animation early
+    _, _, n, _ = _newton_animation_steps(f, fprime, x0, fx0, nmax, 0.0, 0.0, epsilon,
+                                         out=(x_vals, fx_vals, tangents))
     
-    x = x0
-    for _ in range(nmax):
+    # Each tangent crosses the x-axis at the following iterate
+    next_x = x_vals[1:n + 1]
+    
+    return x_vals[:n + 1], fx_vals[:n + 1], tangents[:n], next_x
+
+# Batch Function
+def newton_batch(f, fprime, x0_arr, nmax, err1, err2, epsilon):
+    """
+    Newton's Method run on many initial guesses at once.
+    f and fprime must accept NumPy arrays. All guesses advance together and
+    each one stops under the same criteria as newton_method.
+    Returns arrays (x, f(x), iterations, converged), one entry per guess.
+    """
+    x = np.array(x0_arr, dtype=float)
+    fx = f(x)
+    active = np.ones(x.shape, dtype=bool)
+    converged = np.zeros(x.shape, dtype=bool)
+    iterations = np.zeros(x.shape, dtype=int)
+    
+    for _ in range(1, nmax):
         fp = fprime(x)
-        if abs(fp) < epsilon:
+        active &= np.abs(fp) >= epsilon
+        if not active.any():
             break
-        d = f(x) / fp
-        x_new = x - d
-        tangents.append((x, f(x), fp))
-        x = x_new
-        x_vals.append(x)
-        fx_vals.append(f(x))
+        
+        d = np.divide(fx, fp, out=np.zeros_like(x), where=active)
+        x -= d
+        fx = f(x)
+        iterations += active
+        
+        done = active & ((np.abs(d) < err1) | (np.abs(fx) < err2))
+        converged |= done
+        active &= ~done
     
-    return x_vals, fx_vals, tangents
+    return x, fx, iterations, converged
@@ -1,6 +1,55 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+
+def _make_secant(record):
+    """
+    Build a secant iteration loop that reports each step to record.
+    
+    record(out, i, x0, fx0, x1, fx1, d, x_new, fx_new) is called after step i
+    draws the secant through (x0, fx0) and (x1, fx1) to reach x_new, with the
+    caller's out object passed through unchanged. The returned function starts
+    from the two guesses and their function values, runs at most nmax steps
+    and returns (x1, f(x1), iterations, converged). Stopping early without
+    converging means the function values became too close.
+    """
+    def run(f, x0, fx0, x1, fx1, nmax, err1, err2, epsilon, out=None):
+        for i in range(1, nmax + 1):
+            if abs(fx1 - fx0) < epsilon:
+                return x1, fx1, i - 1, False
+            
+            d = fx1 * (x1 - x0) / (fx1 - fx0)
+            x_new = x1 - d
+            fx_new = f(x_new)
+            record(out, i, x0, fx0, x1, fx1, d, x_new, fx_new)
+            x0, x1 = x1, x_new
+            fx0, fx1 = fx1, fx_new
+            if abs(d) < err1 or abs(fx1) < err2:
+                return x1, fx1, i, True
+        
+        return x1, fx1, nmax, False
+    return run
+
+def _ignore_step(out, i, x0, fx0, x1, fx1, d, x_new, fx_new):
+    pass
+
+def _print_and_store_step(out, i, x0, fx0, x1, fx1, d, x_new, fx_new):
+    x_vals, fx_vals = out
+    x_vals[i + 1] = x_new
+    fx_vals[i + 1] = fx_new
+    print(f"\nIteration {i}:\n"
+          f"x1 = {x_new}\n"
+          f"f(x1) = {fx_new}\n"
+          f"difference = {d}")
+
+def _store_secant_step(out, i, x0, fx0, x1, fx1, d, x_new, fx_new):
+    x_vals, fx_vals, secants = out
+    secants[i - 1] = x0, fx0, x1, fx1
+    x_vals[i + 1] = x_new
+    fx_vals[i + 1] = fx_new
+
+# Loop specializations shared by the functions below
+_secant_core = _make_secant(_ignore_step)
+_secant_plot_steps = _make_secant(_print_and_store_step)
+_secant_animation_steps = _make_secant(_store_secant_step)
 
 def secant_method(f, x0, x1, nmax, err1, err2, epsilon):
     """
@@ -18,18 +67,14 @@ def secant_method(f, x0, x1, nmax, err1, err2, epsilon):
     fx1 = f(x1)
     print(f"x0: {x0}\nf(x0): {fx0}\nx1: {x1}\nf(x1): {fx1}")
     
-    for i in range(1, nmax):
-        if abs(fx1 - fx0) < epsilon:
-            print("Small Difference in Function Values")
-            return
-        
-        d = fx1 * (x1 - x0) / (fx1 - fx0)
-        x0, x1 = x1, x1 - d
-        fx0, fx1 = fx1, f(x1)
+    # Iterations run over range(1, nmax)
+    x1, fx1, i, converged = _secant_core(f, x0, fx0, x1, fx1, nmax - 1, err1, err2, epsilon)
+    if converged:
         print(f"i: {i}\nx1: {x1}\nf(x1): {fx1}")
-        if abs(d) < err1 or abs(fx1) < err2:
-            print("Converge")
-            return f"Zero at ({x1}, {fx1})"
+        print("Converge")
+        return f"Zero at ({x1}, {fx1})"
+    if i < nmax - 1:
+        print("Small Difference in Function Values")
 
 def secant_method_with_plot(f, x0, x1, nmax, err1, err2, epsilon):
     """
@@ -38,45 +83,71 @@ def secant_method_with_plot(f, x0, x1, nmax, err1, err2, epsilon):
     print("Starting Secant Method...\n")
     fx0 = f(x0)
     fx1 = f(x1)
-    x_vals = [x0, x1]
-    fx_vals = [fx0, fx1]
+    x_vals = np.empty(nmax + 2)
+    fx_vals = np.empty(nmax + 2)
+    x_vals[:2] = x0, x1
+    fx_vals[:2] = fx0, fx1
     
     print(f"Initial guesses:\nx0 = {x0}\nf(x0) = {fx0}\nx1 = {x1}\nf(x1) = {fx1}")
     
-    for i in range(1, nmax + 1):
-        if abs(fx1 - fx0) < epsilon:
-            print(f"\nIteration {i}:\nSmall difference in function values encountered. Stopping computation.")
-            break
-        
-        d = fx1 * (x1 - x0) / (fx1 - fx0)
-        x0, x1 = x1, x1 - d
-        fx0, fx1 = fx1, f(x1)
-        x_vals.append(x1)
-        fx_vals.append(fx1)
-        print(f"\nIteration {i}:\n"
-              f"x1 = {x1}\n"
-              f"f(x1) = {fx1}\n"
-              f"difference = {d}")
-        
-        if abs(d) < err1 or abs(fx1) < err2:
-            print("\nConvergence achieved.")
-            break
+    _, _, n, converged = _secant_plot_steps(f, x0, fx0, x1, fx1, nmax, err1, err2, epsilon,
+                                            out=(x_vals, fx_vals))
+    if converged:
+        print("\nConvergence achieved.")
+    elif n < nmax:
+        print(f"\nIteration {n + 1}:\nSmall difference in function values encountered. Stopping computation.")
     
-    return x_vals, fx_vals
+    return x_vals[:n + 2], fx_vals[:n + 2]
 
 def secant_animation(f, x0, x1, nmax, epsilon):
     # Initialize variables
-    x_vals = [x0, x1]
-    fx_vals = [f(x0), f(x1)]
-    secants = []
+    x_vals = np.empty(nmax + 2)
+    fx_vals = np.empty(nmax + 2)
+    secants = np.empty((nmax, 4))
+    
+    fx0 = f(x0)
+    fx1 = f(x1)
+    x_vals[:2] = x0, x1
+    fx_vals[:2] = fx0, fx1
+    # Run every step up to nmax: only close function values stop the animation early
+    _, _, n, _ = _secant_animation_steps(f, x0, fx0, x1, fx1, nmax, 0.0, 0.0, epsilon,
+                                         out=(x_vals, fx_vals, secants))
     
-    for _ in range(nmax):
-        if abs(fx_vals[-1] - fx_vals[-2]) < epsilon:
+    # Each secant crosses the x-axis at the iterate two steps ahead
+    next_x = x_vals[2:n + 2]
+    
+    return x_vals[:n + 2], fx_vals[:n + 2], secants[:n], next_x
+
+def secant_batch(f, x0_arr, x1_arr, nmax, err1, err2, epsilon):
+    """
+    Secant Method run on many pairs of initial guesses at once.
+    f must accept NumPy arrays. All pairs advance together and each one
+    stops under the same criteria as secant_method.
+    Returns arrays (x1, f(x1), iterations, converged), one entry per pair.
+    """
+    x0 = np.array(x0_arr, dtype=float)
+    x1 = np.array(x1_arr, dtype=float)
+    fx0 = f(x0)
+    fx1 = f(x1)
+    active = np.ones(x1.shape, dtype=bool)
+    converged = np.zeros(x1.shape, dtype=bool)
+    iterations = np.zeros(x1.shape, dtype=int)
+    
+    for _ in range(1, nmax):
+        dfx = fx1 - fx0
+        active &= np.abs(dfx) >= epsilon
+        if not active.any():
             break
-        d = fx_vals[-1] * (x_vals[-1] - x_vals[-2]) / (fx_vals[-1] - fx_vals[-2])
-        x_new = x_vals[-1] - d
-        secants.append((x_vals[-2], fx_vals[-2], x_vals[-1], fx_vals[-1]))
-        x_vals.append(x_new)
-        fx_vals.append(f(x_new))
+        
+        d = np.divide(fx1 * (x1 - x0), dfx, out=np.zeros_like(x1), where=active)
+        x0 = np.where(active, x1, x0)
+        fx0 = np.where(active, fx1, fx0)
+        x1 = x1 - d
+        fx1 = f(x1)
+        iterations += active
+        
+        done = active & ((np.abs(d) < err1) | (np.abs(fx1) < err2))
+        converged |= done
+        active &= ~done
     
-    return x_vals, fx_vals, secants
\ No newline at end of file
+    return x1, fx1, iterations, converged
@@ -17,22 +17,33 @@ For each method and function, the program:
 3. Compares performance metrics between methods
 """
 
-from Bisect_Method import bisect_method_with_plot as bisect_plot, bisect_animation as bisect_anim
-from Newton_Method import newton_method_with_plot as newton_plot, newton_animation as newton_anim
-from Secant_Method import secant_method_with_plot as secant_plot, secant_animation as secant_anim
+from Bisect_Method import bisect_method_with_plot as bisect_plot
+from Newton_Method import newton_method_with_plot as newton_plot
+from Secant_Method import secant_method_with_plot as secant_plot
 from Animation_Manager import manage_animations
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 import math
+import sys
+
+# Scalar calls from the solvers go through math, array calls from the plots through NumPy
+def _sin(x):
+    """sin(x) for a scalar or a NumPy array"""
+    return np.sin(x) if isinstance(x, np.ndarray) else math.sin(x)
+
+def _cos(x):
+    """cos(x) for a scalar or a NumPy array"""
+    return np.cos(x) if isinstance(x, np.ndarray) else math.cos(x)
 
 # Define test functions and their derivatives
 def f1(x):
     """f1(x) = x^2 - 4*sin(x)"""
-    return x**2 - 4 * np.sin(x)
+    return x*x - 4 * _sin(x)
 
 def f2(x):
     """f2(x) = x^2 - 1"""
-    return x**2 - 1
+    return x*x - 1
 
 def f3(x):
     """f3(x) = x^3 - 3*x^2 + 3*x - 1"""
@@ -40,7 +51,7 @@ def f3(x):
 
 def f1_prime(x):
     """Derivative of f1(x)"""
-    return 2*x - 4 * np.cos(x)
+    return 2*x - 4 * _cos(x)
 
 def f2_prime(x):
     """Derivative of f2(x)"""
@@ -50,45 +61,70 @@ def f3_prime(x):
     """Derivative of f3(x)"""
     return 3*x**2 - 6*x + 3
 
-def plot_convergence_graphs(x_vals, fx_vals, method_name, fname, subplot_position):
+# Fused value-and-derivative forms for Newton's method, sharing work between f and f'
+def f1_fused(x):
+    """(f1(x), f1'(x))"""
+    return x*x - 4 * _sin(x), 2*x - 4 * _cos(x)
+
+def f2_fused(x):
+    """(f2(x), f2'(x))"""
+    return x*x - 1, 2*x
+
+def f3_fused(x):
+    """(f3(x), f3'(x))"""
+    x2 = x**2
+    return x**3 - 3*x2 + 3*x - 1, 3*x2 - 6*x + 3
+
+# Test functions by name: (f, fused f and f', label)
+FUNCTIONS = {
+    'f1': (f1, f1_fused, "f1(x) = x^2 - 4*sin(x)"),
+    'f2': (f2, f2_fused, "f2(x) = x^2 - 1"),
+    'f3': (f3, f3_fused, "f3(x) = x^3 - 3*x^2 + 3*x - 1"),
+}
+
+# Grid scanned for sign changes to find a bisection bracket
+BRACKET_GRID = np.linspace(-4, 2, 200)
+
+def plot_convergence_graphs(ax_f, ax_diff, x_vals, fx_vals, method_name, fname):
     """
     Create convergence plots for a method showing:
     1. Function value convergence to 0
     2. Consecutive iteration difference convergence
     
     Parameters:
-    - x_vals: List of x values from iterations
-    - fx_vals: List of f(x) values from iterations
+    - ax_f: Axes for the f(x) plot
+    - ax_diff: Axes for the consecutive difference plot
+    - x_vals: Array of x values from iterations
+    - fx_vals: Array of f(x) values from iterations
     - method_name: Name of the method being plotted
     - fname: Name of the function being analyzed
-    - subplot_position: Position in the subplot grid
     """
-    iterations = list(range(len(x_vals)))
+    x_arr = np.asarray(x_vals, dtype=np.float64)
+    fx_arr = np.asarray(fx_vals, dtype=np.float64)
+    iterations = np.arange(len(x_arr))
     
-    # Plot f(x) vs iterations
-    plt.subplot(3, 2, subplot_position)
-    plt.plot(iterations, fx_vals, marker='o', label=f"f(x) - {method_name}")
-    plt.axhline(0, color='red', linestyle='--', label="y=0 (root line)")
-    plt.xlabel("Iteration")
-    plt.ylabel("f(x)")
-    plt.title(f"Convergence of f(x) - {method_name} for {fname}")
-    plt.legend()
-    plt.yscale('symlog')  # Use symlog for better visualization of near-zero values
-    plt.grid(True, alpha=0.3)
+    # Plot log10|f(x)| vs iterations on a linear axis; only exact zeros are moved, to a 1e-16 floor
+    log_fx = np.log10(np.where(fx_arr == 0, 1e-16, np.abs(fx_arr)))
+    ax_f.plot(iterations, log_fx, marker='o', label=f"log10|f(x)| - {method_name}")
+    ax_f.axhline(np.log10(1e-12), color='red', linestyle='--', label="Tolerance |f(x)| = 1e-12")
+    ax_f.set_xlabel("Iteration")
+    ax_f.set_ylabel("log10|f(x)|")
+    ax_f.set_title(f"Convergence of f(x) - {method_name} for {fname}")
+    ax_f.legend()
+    ax_f.grid(True, alpha=0.3)
     
     # Plot absolute differences vs iterations
-    plt.subplot(3, 2, subplot_position + 1)
-    differences = [abs(x_vals[i + 1] - x_vals[i]) for i in range(len(x_vals) - 1)]
-    plt.plot(iterations[:-1], differences, marker='x', label=f"|x_(i+1) - x_i| - {method_name}")
-    plt.axhline(1e-12, color='green', linestyle='--', label="Convergence threshold")  # Updated threshold
-    plt.xlabel("Iteration")
-    plt.ylabel("|x_(i+1) - x_i|")
-    plt.title(f"Convergence of x - {method_name} for {fname}")
-    plt.legend()
-    plt.yscale('log')  # Use log scale to better visualize convergence
-    plt.grid(True, alpha=0.3)
-
-def calculate_convergence_rate(x_vals):
+    differences = np.abs(np.diff(x_arr))
+    ax_diff.plot(iterations[:-1], differences, marker='x', label=f"|x_(i+1) - x_i| - {method_name}")
+    ax_diff.axhline(1e-12, color='green', linestyle='--', label="Convergence threshold")  # Updated threshold
+    ax_diff.set_xlabel("Iteration")
+    ax_diff.set_ylabel("|x_(i+1) - x_i|")
+    ax_diff.set_title(f"Convergence of x - {method_name} for {fname}")
+    ax_diff.legend()
+    ax_diff.set_yscale('log')  # Use log scale to better visualize convergence
+    ax_diff.grid(True, alpha=0.3)
+
+def calculate_convergence_rate(x: np.ndarray) -> float:
     """
     Calculate the empirical convergence rate using consecutive errors in the iteration sequence.
     
@@ -99,50 +135,123 @@ def calculate_convergence_rate(x_vals):
         - p is the convergence rate we're estimating
     
     Taking logarithms: log(|e_{n+1}|) ≈ log(C) + p*log(|e_n|)
-    So p ≈ log(|e_{n+1}|)/log(|e_n|) as n gets large.
+    So p is the slope of a least-squares line through the points (log|e_n|, log|e_{n+1}|).
     
     Parameters:
     -----------
-    x_vals : list
-        A sequence of x values from an iterative root-finding method, 
+    x : np.ndarray
+        A float64 array of x values from an iterative root-finding method, 
         assumed to be converging to a root.
         
     Returns:
     --------
-    float or str
+    float
         The estimated convergence rate if sufficient data is available.
-        Returns "Insufficient data" if there aren't enough points for a reliable estimate.
+        Returns NaN if there aren't enough points for a reliable estimate (see format_rate).
         
     Notes:
     ------
     - A rate close to 1 indicates linear convergence (typical of bisection method)
     - A rate close to 2 indicates quadratic convergence (typical of Newton's method)
     - A rate close to 1.618 indicates superlinear convergence (typical of secant method)
-    - We use the final value in x_vals as an approximation of the true root x*
+    - We use the final value in x as an approximation of the true root x*
     """
-    if len(x_vals) < 4:  # Need at least 4 points to estimate rate
-        return "Insufficient data"
+    if len(x) < 4:  # Need at least 4 points to estimate rate
+        return np.nan
     
-    # Use the last value as approximation of x*
-    x_star = x_vals[-1]
-    # Calculate errors for each iteration relative to our approximated root
-    errors = [abs(x - x_star) for x in x_vals[:-1]]
+    # Calculate errors for each iteration relative to the last value, our approximated root
+    errors = np.abs(x[:-1] - x[-1])
     
     # Filter out very small errors to avoid numerical instability and log(0) errors
-    filtered_errors = [(errors[i], errors[i+1]) 
-                      for i in range(len(errors)-1) 
-                      if errors[i] > 1e-10 and errors[i+1] > 1e-10]
+    mask = (errors[:-1] > 1e-10) & (errors[1:] > 1e-10)
+    e1 = errors[:-1][mask]
+    e2 = errors[1:][mask]
     
-    if len(filtered_errors) < 3:
-        return "Insufficient data"
+    if len(e1) < 3:
+        return np.nan
     
-    # Calculate convergence rates using the formula p ≈ log(|e_{n+1}|)/log(|e_n|)
-    rates = [math.log(e2) / math.log(e1) if e1 != 1 else 0 
-             for e1, e2 in filtered_errors]
+    # Fit log(|e_{n+1}|) = p*log(|e_n|) + log(C); the slope is the convergence rate
+    p, _ = np.polyfit(np.log(e1), np.log(e2), 1)
+    return float(p)
+
+def format_rate(rate: float) -> str:
+    """Format a rate from calculate_convergence_rate for display, NaN meaning insufficient data."""
+    return "Insufficient data" if np.isnan(rate) else str(rate)
+
+def analyze_function(f_name):
+    """
+    Run the three root-finding methods on one test function from FUNCTIONS,
+    printing their progress, and return the iterates and empirical rates of each method.
+    """
+    f, f_fused, fname = FUNCTIONS[f_name]
     
-    # Return the average of the last few rates for more stability
-    # (early iterations may not yet exhibit the asymptotic behavior)
-    return sum(rates[-3:]) / len(rates[-3:]) if rates else "Insufficient data"
+    print("\n" + "=" * 80)
+    print(f"ANALYZING {fname}")
+    print("=" * 80)
+
+    print("\n1. Bisection Method:")
+    # Select the first grid cell where f changes sign (same sign convention as bisection)
+    negative = f(BRACKET_GRID) < 0
+    sign_changes = np.flatnonzero(negative[:-1] != negative[1:])
+    best_bisect_result = None
+    
+    if len(sign_changes) > 0:
+        a, b = BRACKET_GRID[sign_changes[0]], BRACKET_GRID[sign_changes[0] + 1]
+        # Updated error tolerances from 1e-6 to 1e-12
+        best_bisect_result = bisect_plot(a=a, b=b, M=100, err1=1e-12, epsilon=1e-12, f=f)
+        print(f"  Root found in interval [{a:.6g}, {b:.6g}]")
+    
+    # Set up default values in case bisection fails
+    bisect_x_vals = np.empty(0)
+    bisect_fx_vals = np.empty(0)
+    bisect_rate = np.nan
+    
+    if best_bisect_result is None:
+        print(f"  Bisection Method failed: no sign change in [{BRACKET_GRID[0]:g}, {BRACKET_GRID[-1]:g}].")
+    else:
+        bisect_x_vals = np.asarray(best_bisect_result[0], dtype=np.float64)
+        bisect_fx_vals = np.asarray(best_bisect_result[1], dtype=np.float64)
+        # Calculate empirical convergence rate
+        bisect_rate = calculate_convergence_rate(bisect_x_vals)
+        print(f"  Empirical convergence rate: {format_rate(bisect_rate)}")
+        print(f"  Number of iterations: {len(bisect_x_vals)}")
+        print(f"  Root found: {bisect_x_vals[-1]}")
+        print(f"  f(root): {bisect_fx_vals[-1]}")
+    
+    print("\n2. Newton's Method:")
+    # Updated error tolerances from 1e-6 to 1e-12
+    newton_results = newton_plot(f=f_fused, fprime=None, x0=1.5, nmax=100, err1=1e-12, err2=1e-12, epsilon=1e-12)
+    # Convert once at receipt; plotting and the rate estimate reuse these float64 buffers
+    newton_x_vals = np.asarray(newton_results[0], dtype=np.float64)
+    newton_fx_vals = np.asarray(newton_results[1], dtype=np.float64)
+    
+    # Calculate empirical convergence rate
+    newton_rate = calculate_convergence_rate(newton_x_vals)
+    print(f"  Empirical convergence rate: {format_rate(newton_rate)}")
+    print(f"  Number of iterations: {len(newton_x_vals)}")
+    print(f"  Root found: {newton_x_vals[-1]}")
+    print(f"  f(root): {newton_fx_vals[-1]}")
+    
+    print("\n3. Secant Method:")
+    # Updated error tolerances from 1e-6 to 1e-12
+    secant_results = secant_plot(f=f, x0=0, x1=2, nmax=100, err1=1e-12, err2=1e-12, epsilon=1e-12)
+    # Convert once at receipt; plotting and the rate estimate reuse these float64 buffers
+    secant_x_vals = np.asarray(secant_results[0], dtype=np.float64)
+    secant_fx_vals = np.asarray(secant_results[1], dtype=np.float64)
+    
+    # Calculate empirical convergence rate
+    secant_rate = calculate_convergence_rate(secant_x_vals)
+    print(f"  Empirical convergence rate: {format_rate(secant_rate)}")
+    print(f"  Number of iterations: {len(secant_x_vals)}")
+    print(f"  Root found: {secant_x_vals[-1]}")
+    print(f"  f(root): {secant_fx_vals[-1]}")
+    
+    return {
+        'fname': fname,
+        'bisect': (bisect_x_vals, bisect_fx_vals, bisect_rate),
+        'newton': (newton_x_vals, newton_fx_vals, newton_rate),
+        'secant': (secant_x_vals, secant_fx_vals, secant_rate),
+    }
 
 def main() -> None:
     """
@@ -162,88 +271,30 @@ def main() -> None:
     print("  3. Maximum of 50 iterations")
     print("=" * 80 + "\n")
 
-    functions = [
-        (f1, f1_prime, "f1(x) = x^2 - 4*sin(x)"),
-        (f2, f2_prime, "f2(x) = x^2 - 1"),
-        (f3, f3_prime, "f3(x) = x^3 - 3*x^2 + 3*x - 1")
-    ]
-
-    convergence_data = []
+    # One row per (function, method) pair, stored column-wise; a rate of NaN means insufficient data
+    convergence_dtype = [('fname', 'U40'), ('method', 'U20'), ('iters', 'i4'), ('root', 'f8'),
+                         ('froot', 'f8'), ('rate', 'f8'), ('theory', 'U30')]
+    convergence_data = np.zeros(3 * len(FUNCTIONS), dtype=convergence_dtype)
+    n_rows = 0
+    figures = []
 
-    for f, fprime, fname in functions:
-        print("\n" + "=" * 80)
-        print(f"ANALYZING {fname}")
-        print("=" * 80)
-
-        print("\n1. Bisection Method:")
-        # Select intervals that bracket roots for each function
-        intervals = [(-4, 1), (-2, 2), (-1, 1), (-2, 0), (0, 2)]
-        best_bisect_result = None
-        used_interval = None
-        
-        for a, b in intervals:
-            print(f"  Trying interval [{a}, {b}]...")
-            # Updated error tolerances from 1e-6 to 1e-12
-            bisect_results = bisect_plot(a=a, b=b, M=100, err1=1e-12, epsilon=1e-12, f=f)
-            if not isinstance(bisect_results, str):
-                best_bisect_result = bisect_results
-                used_interval = (a, b)
-                print(f"  Root found in interval [{a}, {b}]")
-                break
-            print(f"  Failed: {bisect_results}")
-        
-        # Set up default values in case bisection fails
-        bisect_x_vals = []
-        bisect_fx_vals = []
-        
-        if best_bisect_result is None:
-            print(f"  Bisection Method failed for all intervals.")
-        else:
-            bisect_x_vals, bisect_fx_vals = best_bisect_result
-            # Calculate empirical convergence rate
-            bisect_rate = calculate_convergence_rate(bisect_x_vals)
-            print(f"  Empirical convergence rate: {bisect_rate}")
-            print(f"  Number of iterations: {len(bisect_x_vals)}")
-            print(f"  Root found: {bisect_x_vals[-1]}")
-            print(f"  f(root): {bisect_fx_vals[-1]}")
-        
-        print("\n2. Newton's Method:")
-        # Updated error tolerances from 1e-6 to 1e-12
-        newton_results = newton_plot(f=f, fprime=fprime, x0=1.5, nmax=100, err1=1e-12, err2=1e-12, epsilon=1e-12)
-        newton_x_vals, newton_fx_vals = newton_results
-        # Show animation with increased precision
-        newton_anim(f=f, fprime=fprime, x0=1.5, nmax=100, epsilon=1e-12)
-        
-        # Calculate empirical convergence rate
-        newton_rate = calculate_convergence_rate(newton_x_vals)
-        print(f"  Empirical convergence rate: {newton_rate}")
-        print(f"  Number of iterations: {len(newton_x_vals)}")
-        print(f"  Root found: {newton_x_vals[-1]}")
-        print(f"  f(root): {newton_fx_vals[-1]}")
-        
-        print("\n3. Secant Method:")
-        # Updated error tolerances from 1e-6 to 1e-12
-        secant_results = secant_plot(f=f, x0=0, x1=2, nmax=100, err1=1e-12, err2=1e-12, epsilon=1e-12)
-        secant_x_vals, secant_fx_vals = secant_results
-        # Show animation with increased precision
-        secant_anim(f=f, x0=0, x1=2, nmax=100, epsilon=1e-12)
-        
-        # Calculate empirical convergence rate
-        secant_rate = calculate_convergence_rate(secant_x_vals)
-        print(f"  Empirical convergence rate: {secant_rate}")
-        print(f"  Number of iterations: {len(secant_x_vals)}")
-        print(f"  Root found: {secant_x_vals[-1]}")
-        print(f"  f(root): {secant_fx_vals[-1]}")
+    for f_name in FUNCTIONS:
+        result = analyze_function(f_name)
+        fname = result['fname']
+        bisect_x_vals, bisect_fx_vals, bisect_rate = result['bisect']
+        newton_x_vals, newton_fx_vals, newton_rate = result['newton']
+        secant_x_vals, secant_fx_vals, secant_rate = result['secant']
         
         # Plot all convergence graphs in one window
-        plt.figure(figsize=(15, 10))
-        plt.suptitle(f"Convergence Analysis for {fname}", fontsize=16)
+        fig, axes = plt.subplots(3, 2, figsize=(15, 10))
+        figures.append(fig)
+        fig.suptitle(f"Convergence Analysis for {fname}", fontsize=16)
         
         # Only plot bisection graphs if we have data
         if len(bisect_x_vals) > 0:
-            plot_convergence_graphs(bisect_x_vals, bisect_fx_vals, "Bisection Method", fname, 1)
+            plot_convergence_graphs(axes[0, 0], axes[0, 1], bisect_x_vals, bisect_fx_vals, "Bisection Method", fname)
             # Add to convergence data
-            convergence_data.append((
+            convergence_data[n_rows] = (
                 fname, 
                 "Bisection Method", 
                 len(bisect_x_vals), 
@@ -251,19 +302,22 @@ def main() -> None:
                 bisect_fx_vals[-1],
                 bisect_rate, 
                 "Linear (theoretical)"
-            ))
+            )
+            n_rows += 1
+        else:
+            axes[0, 0].set_visible(False)
+            axes[0, 1].set_visible(False)
         
-        plot_convergence_graphs(newton_x_vals, newton_fx_vals, "Newton's Method", fname, 3)
-        plot_convergence_graphs(secant_x_vals, secant_fx_vals, "Secant Method", fname, 5)
+        plot_convergence_graphs(axes[1, 0], axes[1, 1], newton_x_vals, newton_fx_vals, "Newton's Method", fname)
+        plot_convergence_graphs(axes[2, 0], axes[2, 1], secant_x_vals, secant_fx_vals, "Secant Method", fname)
         
-        plt.tight_layout(rect=[0, 0, 1, 0.95])  # Adjust for suptitle
-        plt.show()
+        fig.tight_layout(rect=[0, 0, 1, 0.95])  # Adjust for suptitle
 
         # Collect convergence data for all methods
         if len(bisect_x_vals) == 0:  # Don't add bisection data if it failed
             print(f"  No convergence data for Bisection Method (method failed)")
         
-        convergence_data.append((
+        convergence_data[n_rows] = (
             fname, 
             "Newton's Method", 
             len(newton_x_vals), 
@@ -271,9 +325,9 @@ def main() -> None:
             newton_fx_vals[-1],
             newton_rate, 
             "Quadratic (theoretical)"
-        ))
+        )
         
-        convergence_data.append((
+        convergence_data[n_rows + 1] = (
             fname, 
             "Secant Method", 
             len(secant_x_vals), 
@@ -281,7 +335,10 @@ def main() -> None:
             secant_fx_vals[-1],
             secant_rate, 
             "Superlinear (theoretical)"
-        ))
+        )
+        n_rows += 2
+
+    convergence_data = convergence_data[:n_rows]
 
     # Print comprehensive comparison table
     print("\n\n" + "=" * 100)
@@ -290,9 +347,12 @@ def main() -> None:
     print(f"{'Function':<20}{'Method':<18}{'Iterations':<12}{'Root':<15}{'f(Root)':<15}{'Empirical Rate':<20}{'Theoretical'}")
     print(f"{'-'*100}")
     
+    # Format every row first and write the table body in one call
+    rows = []
     for data in convergence_data:
-        fname, method, iterations, root, froot, emp_rate, theory = data
-        print(f"{fname[:20]:<20}{method:<18}{iterations:<12}{root:<15.8g}{froot:<15.8g}{str(emp_rate)[:20]:<20}{theory}")
+        fname, method, iterations, root, froot, rate, theory = data.item()
+        rows.append(f"{fname[:20]:<20}{method:<18}{iterations:<12}{root:<15.8g}{froot:<15.8g}{format_rate(rate)[:20]:<20}{theory}")
+    sys.stdout.write("\n".join(rows) + "\n")
     
     print("\nConclusions:")
     print("1. Termination Criteria: Using both |x_{k+1} - x_k| < ε and |f(x_k)| < ε with ε=1e-12 provides")
@@ -307,11 +367,19 @@ def main() -> None:
     print("   - Secant method offers a good compromise, with fast convergence and no need for derivatives")
     print("4. With decreased error tolerances (1e-12), we achieve approximately 12 digits of precision")
 
+    # Show all convergence figures together; headless (Agg) runs save them instead
+    if matplotlib.get_backend().lower() == 'agg':
+        for i, fig in enumerate(figures, start=1):
+            fig.savefig(f"convergence_f{i}.png")
+    else:
+        plt.show()
+
     # After all analyses and comparisons are complete, offer animations
     print("\n\n" + "=" * 80)
     print("INTERACTIVE ANIMATIONS")
     print("=" * 80)
-    manage_animations(f1, f2, f3, f1_prime, f2_prime, f3_prime)
+    # --batch saves the chosen animations as videos instead of opening windows
+    manage_animations(f1, f2, f3, f1_prime, f2_prime, f3_prime, batch='--batch' in sys.argv[1:])
 
     print("\nProgram complete. Thank you for using the Root-Finding Methods Comparison tool.")
 